@@ -14,6 +14,9 @@ setup(
         "pyyaml>=6.0",
         "python-dateutil>=2.8.2",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6.0"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -14,15 +14,49 @@ Usage:
 
 __version__ = "4.2.0"
 
-from .core.engine import AutoRevisionEngine
-from .core.orchestrator import Orchestrator
-from .phases.phase_manager import PhaseManager
-from .hrg.human_review_gate import HumanReviewGate
-from .rol_t.resource_optimizer import ResourceOptimizationLayer
-from .reproducibility.state_manager import StateManager
-from .ethics.axiom_framework import AxiomFramework
-from .audit.audit_logger import AuditLogger
-from .__main__ import main as cli_main
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.engine import AutoRevisionEngine
+    from .core.orchestrator import Orchestrator
+    from .phases.phase_manager import PhaseManager
+    from .hrg.human_review_gate import HumanReviewGate
+    from .rol_t.resource_optimizer import ResourceOptimizationLayer
+    from .reproducibility.state_manager import StateManager
+    from .ethics.axiom_framework import AxiomFramework
+    from .audit.audit_logger import AuditLogger
+    from .__main__ import main as cli_main
+
+# Public name -> (submodule, attribute). Resolved on first access (PEP 562) so
+# that importing the package, or running the CLI's --help, does not pay for
+# loading every subsystem up front.
+_LAZY = {
+    "AutoRevisionEngine": ("core.engine", "AutoRevisionEngine"),
+    "Orchestrator": ("core.orchestrator", "Orchestrator"),
+    "PhaseManager": ("phases.phase_manager", "PhaseManager"),
+    "HumanReviewGate": ("hrg.human_review_gate", "HumanReviewGate"),
+    "ResourceOptimizationLayer": ("rol_t.resource_optimizer", "ResourceOptimizationLayer"),
+    "StateManager": ("reproducibility.state_manager", "StateManager"),
+    "AxiomFramework": ("ethics.axiom_framework", "AxiomFramework"),
+    "AuditLogger": ("audit.audit_logger", "AuditLogger"),
+    "cli_main": ("__main__", "main"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "AutoRevisionEngine",
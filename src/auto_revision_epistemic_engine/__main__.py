@@ -5,89 +5,313 @@ Enables: python -m auto_revision_epistemic_engine
 """
 
 import argparse
+import dataclasses
 import json
+import mmap
+import os
+import re
 import sys
 import tempfile
-from typing import Optional
+from datetime import date, datetime, time
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from .core.engine import AutoRevisionEngine
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+
+# Config files at least this large are memory-mapped rather than copied into a
+# bytes object; below it a plain read() is cheaper than setting up the mapping.
+MMAP_THRESHOLD = 1 << 20
+
+# orjson only represents integers within 64 bits: it refuses to encode larger
+# ones and decodes them as floats. Any run of this many digits might be out of
+# range, so such documents go through the stdlib json module instead.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode values the JSON encoders do not handle natively.
+
+    orjson already serializes datetimes, enums, UUIDs and dataclasses itself;
+    the same conversions here keep the stdlib fallback's output identical.
+    str() remains the last resort for anything else.
+    """
+    if hasattr(obj, "model_dump"):  # pydantic models
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+def _dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+    """Serialize a report to UTF-8 JSON, preferring orjson when installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option, default=_json_default)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default).encode()
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def _write_stdout(payload: bytes) -> None:
+    """
+    Write encoded output to stdout.
+
+    Goes straight to sys.stdout.buffer when there is one, skipping the text
+    layer. Text-only streams (e.g. io.StringIO under redirect_stdout) get the
+    decoded text instead.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(payload)
+
+
+def _flush_stdout() -> None:
+    """Flush whichever stdout layer _write_stdout wrote to."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    (buffer if buffer is not None else sys.stdout).flush()
+
+
+def _write_document(obj: Any, indent: bool = True, flush: bool = False) -> None:
+    """
+    Write one JSON document and its trailing newline to stdout in a single call.
+
+    Callers flush only where output must be visible immediately (e.g.
+    progress messages) rather than after every document.
+    """
+    _write_stdout(_dumps_bytes(obj, indent=indent) + b"\n")
+    if flush:
+        _flush_stdout()
+
+
+def _print_report(obj: Any) -> None:
+    """
+    Write a single report to stdout.
+
+    Output is indented for a terminal and compact when piped to a file or
+    another process, where the extra whitespace is only encoding overhead.
+    """
+    _write_document(obj, indent=sys.stdout.isatty(), flush=True)
+
+
+def _stream_object(sections: Iterable[Tuple[str, Any]], indent: bool = True) -> None:
+    """
+    Write a JSON object to stdout one top-level key at a time.
+
+    Each value is serialized and written before the next one is produced, so
+    large sections (e.g. the audit trail) never sit in memory alongside the
+    encoded output of the whole object. Without indent the object is written
+    on a single line, suitable for NDJSON output.
+    """
+    _write_stdout(b"{")
+    for index, (key, value) in enumerate(sections):
+        if indent:
+            # Encoded JSON never contains raw newlines inside strings, so the
+            # replace only re-indents the nested structure by one level.
+            _write_stdout(b"".join((
+                b",\n  " if index else b"\n  ",
+                _dumps_bytes(key),
+                b": ",
+                _dumps_bytes(value).replace(b"\n", b"\n  "),
+            )))
+        else:
+            _write_stdout(b"".join((
+                b"," if index else b"",
+                _dumps_bytes(key, indent=False),
+                b":",
+                _dumps_bytes(value, indent=False),
+            )))
+    _write_stdout(b"\n}\n" if indent else b"}\n")
+
+
+def _loads(data: Union[str, bytes, memoryview]) -> Any:
+    """Parse JSON from str or bytes, preferring orjson when installed."""
+    if orjson is not None:
+        if isinstance(data, str):
+            in_range = _LONG_DIGITS.search(data) is None
+        else:
+            in_range = _LONG_DIGITS_BYTES.search(data) is None
+        if in_range:
+            return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _parse_object(
+    data: Union[str, bytes, memoryview], option: str, parser: argparse.ArgumentParser,
+) -> Dict[str, Any]:
+    """
+    Parse a JSON object supplied on the command line.
+
+    Malformed or non-object input is rejected with a usage error before any
+    engine (hashing, directories, phase managers) is set up.
+    """
+    try:
+        value = _loads(data)
+    except ValueError as e:
+        parser.error(f"{option} is not valid JSON: {e}")
+    if not isinstance(value, dict):
+        parser.error(f"{option} must be a JSON object")
+    return value
+
+
+def _load_object_file(path: str, option: str, parser: argparse.ArgumentParser) -> Dict[str, Any]:
+    """
+    Read and parse a JSON object from a file in binary mode.
+
+    Large files are memory-mapped and handed to orjson as a buffer so the
+    contents are never copied onto the Python heap. Anything that cannot be
+    mapped (pipes, other non-regular files) falls back to read().
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            try:
+                mapped: Optional[mmap.mmap] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    return _parse_object(view, option, parser)
+        return _parse_object(f.read(), option, parser)
+
+
+@lru_cache(maxsize=1)
+def _get_engine() -> Type["AutoRevisionEngine"]:
+    """Import AutoRevisionEngine on first use and reuse it afterwards."""
+    from .core.engine import AutoRevisionEngine
+    return AutoRevisionEngine
+
+
+def _ensure_dirs(args: argparse.Namespace, prefix: str = "are_") -> Tuple[str, str]:
+    """
+    Resolve the audit and state directories for a command.
+
+    Uses --audit-dir/--state-dir when given and only falls back to a fresh
+    temporary directory for whichever one is missing.
+    """
+    audit_dir = getattr(args, "audit_dir", None) or tempfile.mkdtemp(prefix=f"{prefix}audit_")
+    state_dir = getattr(args, "state_dir", None) or tempfile.mkdtemp(prefix=f"{prefix}state_")
+    return audit_dir, state_dir
 
 
 def cmd_run(args: argparse.Namespace) -> int:
     """Execute the 8-phase pipeline with configurable inputs."""
-    from auto_revision_epistemic_engine import AutoRevisionEngine
+    AutoRevisionEngine = _get_engine()
+    parser = _command_parser("run")
+
+    # Load the config file once; it supplies both inputs and pipeline config
+    config: Dict[str, Any] = {}
+    if args.inputs_file:
+        config = _load_object_file(args.inputs_file, "--inputs-file", parser)
 
     # Parse inputs from JSON string or file
     inputs = {}
     if args.inputs:
-        inputs = json.loads(args.inputs)
+        inputs = _parse_object(args.inputs, "--inputs", parser)
     elif args.inputs_file:
-        with open(args.inputs_file, "r") as f:
-            config = json.load(f)
-            inputs = config.get("inputs", config)
-
-    # Extract pipeline config from file if provided
-    pipeline_id = args.pipeline_id
-    random_seed: Optional[int] = args.seed
-    enable_hrg = not args.no_hrg
-    enable_ethics = not args.no_ethics
-
-    if args.inputs_file:
-        with open(args.inputs_file, "r") as f:
-            config = json.load(f)
-            pipeline_id = config.get("pipeline_id", pipeline_id)
-            random_seed = config.get("random_seed", random_seed)
-            hrg_cfg = config.get("hrg_config", {})
-            if hrg_cfg.get("auto_approve") is not None:
-                enable_hrg = True
-            ethics_cfg = config.get("ethics_config", {})
-            if ethics_cfg.get("enabled") is not None:
-                enable_ethics = ethics_cfg["enabled"]
-
+        inputs = config.get("inputs", config)
+        if not isinstance(inputs, dict):
+            parser.error('"inputs" in --inputs-file must be a JSON object')
+
+    pipeline_id = config.get("pipeline_id", args.pipeline_id)
+    random_seed: Optional[int] = config.get("random_seed", args.seed)
+    enable_hrg = not (args.no_hrg or args.fast)
+    enable_ethics = not (args.no_ethics or args.fast)
+
+    # --fast overrides any HRG/ethics settings in the config file
+    if not args.fast:
+        hrg_cfg = config.get("hrg_config", {})
+        if hrg_cfg.get("auto_approve") is not None:
+            enable_hrg = True
+        ethics_cfg = config.get("ethics_config", {})
+        if ethics_cfg.get("enabled") is not None:
+            enable_ethics = ethics_cfg["enabled"]
+
+    audit_dir, state_dir = _ensure_dirs(args)
     engine = AutoRevisionEngine(
         pipeline_id=pipeline_id,
         random_seed=random_seed,
         enable_hrg=enable_hrg,
         enable_ethics_audit=enable_ethics,
-        audit_log_dir=args.audit_dir or tempfile.mkdtemp(prefix="are_audit_"),
-        state_dir=args.state_dir or tempfile.mkdtemp(prefix="are_state_"),
+        enable_resource_tracking=not args.fast,
+        audit_log_dir=audit_dir,
+        state_dir=state_dir,
     )
 
     result = engine.execute(inputs=inputs)
-    print(json.dumps(result, indent=2, default=str))
+    _print_report(result)
     return 0 if result.get("success") else 1
 
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show pipeline status after initialization."""
-    from auto_revision_epistemic_engine import AutoRevisionEngine
+    AutoRevisionEngine = _get_engine()
 
+    audit_dir, state_dir = _ensure_dirs(args)
     engine = AutoRevisionEngine(
         pipeline_id=args.pipeline_id,
         random_seed=args.seed,
-        audit_log_dir=args.audit_dir or tempfile.mkdtemp(prefix="are_audit_"),
-        state_dir=args.state_dir or tempfile.mkdtemp(prefix="are_state_"),
+        audit_log_dir=audit_dir,
+        state_dir=state_dir,
     )
 
     status = engine.get_status()
-    print(json.dumps(status, indent=2, default=str))
+    _print_report(status)
     return 0
 
 
 def cmd_audit(args: argparse.Namespace) -> int:
     """Verify audit chain integrity."""
-    from auto_revision_epistemic_engine import AutoRevisionEngine
-
-    engine = AutoRevisionEngine(
-        pipeline_id=args.pipeline_id or "audit-check",
-        audit_log_dir=args.audit_dir or tempfile.mkdtemp(prefix="are_audit_"),
-        state_dir=args.state_dir or tempfile.mkdtemp(prefix="are_state_"),
-    )
+    AutoRevisionEngine = _get_engine()
 
-    # Run pipeline first if requested
     if args.after_run:
+        # Run pipeline first, then verify the chain it produced
+        audit_dir, state_dir = _ensure_dirs(args)
+        engine = AutoRevisionEngine(
+            pipeline_id=args.pipeline_id or "audit-check",
+            audit_log_dir=audit_dir,
+            state_dir=state_dir,
+        )
         engine.execute(inputs={"data": {"source": "audit-verification"}})
+        audit_trail = engine.get_audit_trail()
+    else:
+        # Verify an existing chain without standing up the pipeline
+        parser = _command_parser("audit")
+        if not args.audit_dir:
+            parser.error("--audit-dir is required unless --after-run is given")
+        try:
+            audit_trail = AutoRevisionEngine.reader(args.audit_dir).get_trail_summary()
+        except FileNotFoundError as e:
+            parser.error(str(e))
 
-    audit_trail = engine.get_audit_trail()
-    print(json.dumps(audit_trail, indent=2, default=str))
+    _print_report(audit_trail)
 
     if audit_trail["chain_valid"]:
         print("\n[OK] Audit chain integrity verified.", file=sys.stderr)
@@ -98,14 +322,21 @@ def cmd_audit(args: argparse.Namespace) -> int:
 
 
 def cmd_demo(args: argparse.Namespace) -> int:
-    """Run a demonstration with sample data."""
-    import tempfile
-    from auto_revision_epistemic_engine import AutoRevisionEngine
+    """
+    Run a demonstration with sample data.
 
-    audit_dir = tempfile.mkdtemp(prefix="are_demo_audit_")
-    state_dir = tempfile.mkdtemp(prefix="are_demo_state_")
+    Each stage is emitted as one compact JSON object per line (NDJSON) so the
+    output can be piped into jq or a line-oriented log consumer; --pretty
+    switches to indented, multi-line objects for reading in a terminal.
+    """
+    pretty = args.pretty
+    AutoRevisionEngine = _get_engine()
 
-    print(json.dumps({"stage": "init", "message": "Initializing demo engine..."}, indent=2))
+    audit_dir, state_dir = _ensure_dirs(args, prefix="are_demo_")
+
+    _write_document(
+        {"stage": "init", "message": "Initializing demo engine..."}, indent=pretty, flush=True,
+    )
 
     engine = AutoRevisionEngine(
         pipeline_id="demo-eight-phase",
@@ -128,39 +359,42 @@ def cmd_demo(args: argparse.Namespace) -> int:
         weight=1.0,
     )
 
-    print(json.dumps({"stage": "execute", "message": "Executing 8-phase pipeline..."}, indent=2))
+    _write_document(
+        {"stage": "execute", "message": "Executing 8-phase pipeline..."}, indent=pretty, flush=True,
+    )
 
     result = engine.execute(inputs={
         "data": {"records": 100, "format": "demo"},
         "source": "demo-cli",
     })
 
-    print(json.dumps({"stage": "result", "pipeline_result": result}, indent=2, default=str))
-
-    # Gather all reports
-    reports = {
-        "stage": "reports",
-        "status": engine.get_status(),
-        "audit_trail": engine.get_audit_trail(),
-        "reproducibility": engine.get_reproducibility_info(),
-        "resource_report": engine.get_resource_report(),
-        "ethics_report": engine.get_ethics_report(),
-        "hrg_report": engine.get_hrg_report(),
-    }
+    _write_document({"stage": "result", "pipeline_result": result}, indent=pretty)
+
+    # Stream all reports, building each section only when it is written
+    report_sections = (
+        ("stage", lambda: "reports"),
+        ("status", engine.get_status),
+        ("audit_trail", engine.get_audit_trail),
+        ("reproducibility", engine.get_reproducibility_info),
+        ("resource_report", engine.get_resource_report),
+        ("ethics_report", engine.get_ethics_report),
+        ("hrg_report", engine.get_hrg_report),
+    )
+    _stream_object(((key, build()) for key, build in report_sections), indent=pretty)
 
-    print(json.dumps(reports, indent=2, default=str))
-    print(json.dumps({
+    _write_document({
         "stage": "complete",
         "message": "Demo completed successfully.",
         "audit_dir": audit_dir,
         "state_dir": state_dir,
-    }, indent=2))
+    }, indent=pretty, flush=True)
 
     return 0 if result.get("success") else 1
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the CLI argument parser."""
+@lru_cache(maxsize=1)
+def _build_parsers() -> Tuple[argparse.ArgumentParser, Dict[str, argparse.ArgumentParser]]:
+    """Build the CLI argument parser and its per-command subparsers (once per process)."""
     parser = argparse.ArgumentParser(
         prog="auto-revision-epistemic-engine",
         description=(
@@ -192,6 +426,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     run_parser.add_argument("--no-hrg", action="store_true", help="Disable HRG gates")
     run_parser.add_argument("--no-ethics", action="store_true", help="Disable ethics audits")
+    run_parser.add_argument(
+        "--fast", action="store_true",
+        help="Disable HRG gates, ethics audits and resource tracking (e.g. for CI/benchmarks)",
+    )
     run_parser.add_argument("--audit-dir", type=str, default=None, help="Audit log directory")
     run_parser.add_argument("--state-dir", type=str, default=None, help="State snapshot directory")
 
@@ -206,32 +444,84 @@ def build_parser() -> argparse.ArgumentParser:
     audit_parser = subparsers.add_parser("audit", help="Verify audit chain integrity")
     audit_parser.add_argument("--pipeline-id", default=None, help="Pipeline identifier")
     audit_parser.add_argument("--after-run", action="store_true", help="Run pipeline first, then verify")
-    audit_parser.add_argument("--audit-dir", type=str, default=None, help="Audit log directory")
+    audit_parser.add_argument(
+        "--audit-dir", type=str, default=None,
+        help="Audit log directory to verify (required unless --after-run)",
+    )
     audit_parser.add_argument("--state-dir", type=str, default=None, help="State snapshot directory")
 
     # --- demo ---
-    subparsers.add_parser("demo", help="Run a demonstration with sample data")
+    demo_parser = subparsers.add_parser("demo", help="Run a demonstration with sample data")
+    demo_parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent each stage instead of emitting one JSON object per line",
+    )
+
+    return parser, {
+        "run": run_parser,
+        "status": status_parser,
+        "audit": audit_parser,
+        "demo": demo_parser,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    return _build_parsers()[0]
+
+
+def _command_parser(command: str) -> argparse.ArgumentParser:
+    """Get a command's subparser, so usage errors show that command's usage."""
+    return _build_parsers()[1][command]
 
-    return parser
 
+_DISPATCH: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "run": cmd_run,
+    "status": cmd_status,
+    "audit": cmd_audit,
+    "demo": cmd_demo,
+}
 
-def main() -> int:
+
+# Pre-rendered output of build_parser().print_help() at 80 columns for a bare
+# invocation, so that case does not build the argparse tree. Keep in sync with
+# build_parser(). Python < 3.10 argparse titles the last section "optional
+# arguments:", so older interpreters build the parser instead.
+_STATIC_HELP = """\
+usage: auto-revision-epistemic-engine [-h] {run,status,audit,demo} ...
+
+Auto-Revision Epistemic Engine (v4.2) -- A self-governing orchestration
+framework with 8 phases and 4 human oversight gates.
+
+positional arguments:
+  {run,status,audit,demo}
+                        Available commands
+    run                 Execute the 8-phase pipeline
+    status              Show pipeline status
+    audit               Verify audit chain integrity
+    demo                Run a demonstration with sample data
+
+options:
+  -h, --help            show this help message and exit
+"""
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv and sys.version_info >= (3, 10):
+        sys.stdout.write(_STATIC_HELP)
+        return 0
+
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command is None:
         parser.print_help()
         return 0
 
-    dispatch = {
-        "run": cmd_run,
-        "status": cmd_status,
-        "audit": cmd_audit,
-        "demo": cmd_demo,
-    }
-
-    handler = dispatch.get(args.command)
+    handler = _DISPATCH.get(args.command)
     if handler is None:
         parser.print_help()
         return 1
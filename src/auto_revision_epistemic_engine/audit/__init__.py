@@ -1,4 +1,4 @@
 """Audit package"""
-from .audit_logger import AuditLogger, AuditEntry, ComplianceAttestation
+from .audit_logger import AuditLogger, AuditEntry, ComplianceAttestation, IncrementalMerkleTree
 
-__all__ = ["AuditLogger", "AuditEntry", "ComplianceAttestation"]
+__all__ = ["AuditLogger", "AuditEntry", "ComplianceAttestation", "IncrementalMerkleTree"]
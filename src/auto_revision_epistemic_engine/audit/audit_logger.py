@@ -8,9 +8,24 @@ import os
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pydantic import BaseModel, Field
 
+# The Merkle frontier is checkpointed to disk every this many entries and at
+# each attestation, rather than on every append.
+MERKLE_CHECKPOINT_INTERVAL = 256
+
+# Fields covered by an entry's hash, and a shared encoder equivalent to
+# json.dumps(..., sort_keys=True) without rebuilding it on every call.
+_HASHED_FIELDS = ("timestamp", "event_type", "phase", "actor", "action", "metadata", "previous_hash")
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
+def _entry_digest(data: Dict[str, Any]) -> str:
+    """Compute the BLAKE3 entry hash over the hashed fields of an entry or parsed log line"""
+    payload = {name: data.get(name) for name in _HASHED_FIELDS}
+    return blake3.blake3(_HASH_ENCODER.encode(payload).encode()).hexdigest()
+
 
 class AuditEntry(BaseModel):
     """Single audit log entry"""
@@ -25,17 +40,71 @@ class AuditEntry(BaseModel):
 
     def compute_hash(self) -> str:
         """Compute BLAKE3 hash for this entry"""
-        data = {
-            "timestamp": self.timestamp,
-            "event_type": self.event_type,
-            "phase": self.phase,
-            "actor": self.actor,
-            "action": self.action,
-            "metadata": self.metadata,
-            "previous_hash": self.previous_hash,
+        return _entry_digest({name: getattr(self, name) for name in _HASHED_FIELDS})
+
+
+class IncrementalMerkleTree:
+    """
+    Append-only Merkle tree that keeps only its frontier.
+
+    frontier[level] holds the root of a complete subtree of 2**level leaves,
+    or None. Appending a leaf works like incrementing a binary counter: equal
+    sized subtrees are merged upward as carries. Both append and root_hash are
+    O(log n) in time and memory, independent of how many leaves were added.
+    """
+
+    _LEAF_PREFIX = b"\x00"
+    _NODE_PREFIX = b"\x01"
+
+    def __init__(self, size: int = 0, frontier: Optional[List[Optional[bytes]]] = None):
+        self.size = size
+        self.frontier: List[Optional[bytes]] = list(frontier or [])
+
+    @classmethod
+    def _node(cls, left: bytes, right: bytes) -> bytes:
+        return blake3.blake3(cls._NODE_PREFIX + left + right).digest()
+
+    def append(self, leaf: bytes) -> None:
+        """Add a leaf (e.g. an entry hash) and fold carries up the frontier."""
+        carry = blake3.blake3(self._LEAF_PREFIX + leaf).digest()
+        level = 0
+        while level < len(self.frontier):
+            node = self.frontier[level]
+            if node is None:
+                break
+            carry = self._node(node, carry)
+            self.frontier[level] = None
+            level += 1
+        if level == len(self.frontier):
+            self.frontier.append(carry)
+        else:
+            self.frontier[level] = carry
+        self.size += 1
+
+    def root_hash(self) -> bytes:
+        """Combine the frontier subtrees right to left into a single root."""
+        root: Optional[bytes] = None
+        for subtree in self.frontier:
+            if subtree is None:
+                continue
+            root = subtree if root is None else self._node(subtree, root)
+        return root if root is not None else blake3.blake3(b"").digest()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the frontier for persistence."""
+        return {
+            "size": self.size,
+            "frontier": [h.hex() if h is not None else None for h in self.frontier],
+            "root": self.root_hash().hex(),
         }
-        hasher = blake3.blake3(json.dumps(data, sort_keys=True).encode())
-        return hasher.hexdigest()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IncrementalMerkleTree":
+        """Restore a tree from to_dict() output."""
+        return cls(
+            size=data["size"],
+            frontier=[bytes.fromhex(h) if h is not None else None for h in data["frontier"]],
+        )
 
 
 class ComplianceAttestation(BaseModel):
@@ -61,7 +130,11 @@ class AuditLogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file = self.log_dir / "audit_log.jsonl"
         self.attestation_file = self.log_dir / "attestations.jsonl"
+        self.frontier_file = self.log_dir / "merkle_frontier.json"
         self._last_hash: Optional[str] = None
+        self._merkle = IncrementalMerkleTree()
+        self._unfolded: List[str] = []  # Log lines past the checkpoint, folded on first use
+        self._checkpoint_writable = True
         self._lock = threading.Lock()  # Thread safety for concurrent access
         self._initialize_log()
 
@@ -89,6 +162,92 @@ class AuditLogger:
         else:
             # Create new log file
             self.log_file.touch()
+            lines = []
+
+        # Resume the Merkle tree from the last checkpoint; only entries logged
+        # after it are folded in, and not until the tree is first needed. A
+        # checkpoint that is unreadable or covers more entries than the log
+        # holds is left untouched as evidence, and the tree is rebuilt from
+        # the log instead.
+        try:
+            checkpoint = self._read_checkpoint()
+            if checkpoint is not None and checkpoint["size"] <= len(lines):
+                self._merkle = IncrementalMerkleTree.from_dict(checkpoint)
+                lines = lines[checkpoint["size"]:]
+            elif checkpoint is not None:
+                self._checkpoint_writable = False
+        except (IOError, ValueError, TypeError):
+            self._checkpoint_writable = False
+        self._unfolded = lines
+
+    def _tree(self) -> IncrementalMerkleTree:
+        """Get the Merkle tree, folding in log lines not yet covered (caller holds the lock)"""
+        if self._unfolded:
+            for leaf in self._leaf_hashes(self._unfolded):
+                self._merkle.append(leaf)
+            self._unfolded = []
+        return self._merkle
+
+    @staticmethod
+    def _leaf_hashes(lines: List[str]) -> Iterator[bytes]:
+        """Yield the entry hashes of readable log lines"""
+        for line in lines:
+            try:
+                entry_hash = json.loads(line).get("entry_hash")
+                if entry_hash:
+                    yield bytes.fromhex(entry_hash)
+            except (ValueError, AttributeError):
+                continue  # Skip corrupted line
+
+    def _read_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Read the last Merkle checkpoint, or None if none has been written"""
+        if not self.frontier_file.exists():
+            return None
+        with open(self.frontier_file, "r") as f:
+            data = json.load(f)
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("size"), int)
+            or not isinstance(data.get("root"), str)
+            or not isinstance(data.get("frontier"), list)
+        ):
+            raise ValueError(f"Malformed Merkle checkpoint: {self.frontier_file}")
+        return data
+
+    def _save_checkpoint(self):
+        """Atomically persist the Merkle frontier next to the log (caller holds the lock)"""
+        if not self._checkpoint_writable:
+            return
+        tmp_file = self.frontier_file.with_name(self.frontier_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(self._tree().to_dict(), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.frontier_file)
+        except IOError as e:
+            raise RuntimeError(f"Failed to write Merkle checkpoint: {e}")
+
+    def checkpoint(self):
+        """
+        Persist the current Merkle frontier.
+
+        Written to a temporary file and renamed into place, so a crash leaves
+        either the previous checkpoint or the new one. Entries appended after
+        the last checkpoint are still covered by the hash chain.
+        """
+        with self._lock:
+            self._save_checkpoint()
+
+    def merkle_root(self) -> str:
+        """
+        Get the Merkle root over all entry hashes logged so far.
+
+        Returns:
+            str: Hex-encoded root hash
+        """
+        with self._lock:
+            return self._tree().root_hash().hex()
 
     def log_event(
         self,
@@ -122,6 +281,7 @@ class AuditLogger:
             )
             entry.entry_hash = entry.compute_hash()
             self._last_hash = entry.entry_hash
+            tree = self._tree()
 
             # Append to log file with error handling
             try:
@@ -133,6 +293,10 @@ class AuditLogger:
                 # Critical: audit log write failed
                 raise RuntimeError(f"Failed to write audit log: {e}")
 
+            tree.append(bytes.fromhex(entry.entry_hash))
+            if tree.size % MERKLE_CHECKPOINT_INTERVAL == 0:
+                self._save_checkpoint()
+
             return entry
 
     def create_attestation(
@@ -188,6 +352,7 @@ class AuditLogger:
                 "findings": findings or [],
             },
         )
+        self.checkpoint()
 
         return attestation
 
@@ -201,26 +366,65 @@ class AuditLogger:
         if not self.log_file.exists():
             return True
 
+        # A hash chain alone cannot detect entries truncated from the end of
+        # the log; the Merkle root over the entries the last checkpoint covers
+        # must match it too. An unreadable checkpoint counts as a failed check.
+        try:
+            checkpoint = self._read_checkpoint()
+        except (IOError, ValueError):
+            return False
+        tree = IncrementalMerkleTree()
+        checkpoint_root = None
+        if checkpoint is not None and checkpoint["size"] == 0:
+            checkpoint_root = tree.root_hash().hex()
+
         with open(self.log_file, "r") as f:
             lines = f.readlines()
 
         previous_hash = None
         for line in lines:
+            # Hash the parsed line directly; building an AuditEntry per line
+            # would only copy the same fields.
             entry_data = json.loads(line)
-            entry = AuditEntry(**entry_data)
+            entry_hash = entry_data.get("entry_hash")
 
             # Verify previous hash matches
-            if entry.previous_hash != previous_hash:
+            if entry_data.get("previous_hash") != previous_hash:
                 return False
 
             # Verify entry hash
-            expected_hash = entry.compute_hash()
-            if entry.entry_hash != expected_hash:
+            if entry_hash != _entry_digest(entry_data):
                 return False
 
-            previous_hash = entry.entry_hash
+            previous_hash = entry_hash
+            if checkpoint is not None and tree.size < checkpoint["size"]:
+                tree.append(bytes.fromhex(entry_hash))
+                if tree.size == checkpoint["size"]:
+                    checkpoint_root = tree.root_hash().hex()
 
-        return True
+        return checkpoint is None or checkpoint_root == checkpoint["root"]
+
+    def get_trail_summary(self, recent: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the audit trail: chain validity, size, recent entries and attestations.
+
+        Args:
+            recent: Number of leading entries to include
+
+        Returns:
+            Dict with audit trail details
+        """
+        return {
+            "chain_valid": self.verify_chain(),
+            "merkle_root": self.merkle_root(),
+            "total_entries": len(self.get_entries()),
+            "recent_entries": [
+                entry.model_dump() for entry in self.get_entries(limit=recent)
+            ],
+            "attestations": [
+                att.model_dump() for att in self.get_attestations()
+            ],
+        }
 
     def get_entries(
         self,
@@ -2,8 +2,10 @@
 Auto-Revision Epistemic Engine - Main entry point
 """
 
+from pathlib import Path
 from typing import Any, Dict, Optional
 from .orchestrator import Orchestrator, PipelineConfig
+from ..audit.audit_logger import AuditLogger
 
 
 class AutoRevisionEngine:
@@ -53,6 +55,29 @@ class AutoRevisionEngine:
         
         self.orchestrator = Orchestrator(self.config)
 
+    @classmethod
+    def reader(cls, audit_log_dir: str = "./audit_logs") -> AuditLogger:
+        """
+        Open an existing audit log for verification only.
+
+        Unlike constructing a full engine, this sets up no phase manager, HRG,
+        ROL-T, ethics or state manager and appends no ORCHESTRATOR_INIT entry.
+
+        Args:
+            audit_log_dir: Directory containing the audit log
+
+        Returns:
+            AuditLogger: Logger over the existing log; use get_trail_summary()
+            for the same report as get_audit_trail()
+
+        Raises:
+            FileNotFoundError: If the directory holds no audit log
+        """
+        log_file = Path(audit_log_dir) / "audit_log.jsonl"
+        if not log_file.is_file():
+            raise FileNotFoundError(f"No audit log found at {log_file}")
+        return AuditLogger(log_dir=audit_log_dir)
+
     def execute(self, inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute the complete 8-phase pipeline.
@@ -81,18 +106,7 @@ class AutoRevisionEngine:
         Returns:
             Dict with audit trail details
         """
-        audit_logger = self.orchestrator.audit_logger
-        
-        return {
-            "chain_valid": audit_logger.verify_chain(),
-            "total_entries": len(audit_logger.get_entries()),
-            "recent_entries": [
-                entry.model_dump() for entry in audit_logger.get_entries(limit=10)
-            ],
-            "attestations": [
-                att.model_dump() for att in audit_logger.get_attestations()
-            ],
-        }
+        return self.orchestrator.audit_logger.get_trail_summary()
 
     def get_reproducibility_info(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,355 @@
+"""
+Tests for the command-line interface
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from auto_revision_epistemic_engine import __main__ as cli
+
+
+class TestJsonHelpers:
+    """Test cases for the CLI JSON helpers"""
+
+    def test_dumps_round_trip(self):
+        """Test that _dumps_bytes output parses back to the same object"""
+        payload = {"stage": "init", "nested": {"values": [1, 2.5, None, True]}}
+        assert json.loads(cli._dumps_bytes(payload)) == payload
+
+    def test_dumps_falls_back_to_str(self):
+        """Test that unknown types are stringified rather than rejected"""
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        assert json.loads(cli._dumps_bytes({"value": Opaque()})) == {"value": "opaque"}
+
+    def test_typed_values_match_across_encoders(self, monkeypatch):
+        """Test that orjson and the stdlib fallback encode rich types the same way"""
+        import dataclasses
+        import enum
+        import uuid
+        from datetime import datetime, timezone
+        from auto_revision_epistemic_engine.audit import AuditEntry
+
+        class Status(enum.Enum):
+            OK = "OK"
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        payload = {
+            "when": datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc),
+            "status": Status.OK,
+            "id": uuid.UUID(int=1),
+            "point": Point(x=1),
+            "entry": AuditEntry(timestamp="t", event_type="E", actor="A", action="a"),
+        }
+        expected = {
+            "when": "2026-01-02T03:04:05.678000+00:00",
+            "status": "OK",
+            "id": "00000000-0000-0000-0000-000000000001",
+            "point": {"x": 1},
+            "entry": payload["entry"].model_dump(),
+        }
+
+        assert json.loads(cli._dumps_bytes(payload)) == expected
+        monkeypatch.setattr(cli, "orjson", None)
+        assert json.loads(cli._dumps_bytes(payload)) == expected
+
+    def test_loads_accepts_str_and_bytes(self):
+        """Test that _loads parses both str and bytes input"""
+        assert cli._loads('{"data": {"records": 5}}') == {"data": {"records": 5}}
+        assert cli._loads(b'{"data": {"records": 5}}') == {"data": {"records": 5}}
+
+    def test_dumps_integers_beyond_64_bits(self):
+        """Test that integers orjson cannot encode fall back to the stdlib encoder"""
+        payload = {"seed": 123456789012345678901234567890}
+        assert json.loads(cli._dumps_bytes(payload)) == payload
+        assert cli._dumps_bytes(payload, indent=False) == b'{"seed":123456789012345678901234567890}'
+
+    def test_loads_keeps_integers_beyond_64_bits(self):
+        """Test that large integers are parsed exactly rather than as floats"""
+        big = 123456789012345678901234567890
+        assert cli._loads('{"a": %d}' % big) == {"a": big}
+        assert cli._loads(b'{"a": -%d}' % big) == {"a": -big}
+        assert cli._loads(memoryview(b'[%d]' % big)) == [big]
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test that helpers work when orjson is not installed"""
+        monkeypatch.setattr(cli, "orjson", None)
+        payload = {"stage": "complete", "count": 3}
+        assert json.loads(cli._dumps_bytes(payload)) == payload
+        assert cli._dumps_bytes(payload, indent=False) == b'{"stage":"complete","count":3}'
+        assert cli._loads(b'{"count": 3}') == {"count": 3}
+
+    def test_stream_object_matches_single_dump(self, capsys):
+        """Test that streaming key by key yields the same document as one dump"""
+        sections = {"stage": "reports", "trail": {"entries": [{"n": 1}, {"n": 2}]}, "empty": {}}
+        cli._stream_object(iter(sections.items()))
+        assert capsys.readouterr().out == cli._dumps_bytes(sections).decode() + "\n"
+
+    def test_stream_object_compact_is_single_line(self, capsys):
+        """Test that compact streaming writes the object on one line"""
+        sections = {"stage": "reports", "trail": {"entries": [1, 2]}}
+        cli._stream_object(iter(sections.items()), indent=False)
+        out = capsys.readouterr().out
+        assert out == cli._dumps_bytes(sections, indent=False).decode() + "\n"
+
+    def test_print_report_compact_when_piped(self, capsys):
+        """Test that reports are compact when stdout is not a terminal"""
+        cli._print_report({"chain_valid": True, "total_entries": 2})
+        assert capsys.readouterr().out == '{"chain_valid":true,"total_entries":2}\n'
+
+    def test_print_report_indented_for_terminal(self, capsys, monkeypatch):
+        """Test that reports are indented when stdout is a terminal"""
+        monkeypatch.setattr(cli.sys.stdout, "isatty", lambda: True)
+        cli._print_report({"chain_valid": True})
+        assert capsys.readouterr().out == '{\n  "chain_valid": true\n}\n'
+
+
+class TestLazyHandles:
+    """Test cases for the cached parser and engine handles"""
+
+    def test_parser_is_built_once(self):
+        """Test that build_parser returns the same parser on every call"""
+        assert cli.build_parser() is cli.build_parser()
+
+    def test_engine_class_is_resolved_once(self):
+        """Test that _get_engine returns the engine class and caches it"""
+        from auto_revision_epistemic_engine.core.engine import AutoRevisionEngine
+
+        assert cli._get_engine() is AutoRevisionEngine
+        assert cli._get_engine.cache_info().currsize == 1
+
+
+class TestMain:
+    """Test cases for the main entry point"""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="static help uses 3.10+ argparse wording")
+    def test_bare_invocation_prints_static_help(self, capsys):
+        """Test that no arguments prints help without building the parser"""
+        cli._build_parsers.cache_clear()
+        assert cli.main([]) == 0
+        assert capsys.readouterr().out == cli._STATIC_HELP
+        assert cli._build_parsers.cache_info().currsize == 0
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="static help uses 3.10+ argparse wording")
+    def test_static_help_matches_parser_help(self, monkeypatch):
+        """Test that the pre-rendered help is exactly the parser's help at 80 columns"""
+        monkeypatch.setenv("COLUMNS", "80")
+        assert cli._STATIC_HELP == cli.build_parser().format_help()
+
+
+class TestRedirectedStdout:
+    """Test cases for text-only stdout replacements"""
+
+    def test_cli_main_under_redirect_stdout(self, temp_dir):
+        """Test that reports still work when stdout has no binary buffer"""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = cli.main([
+                "status",
+                "--audit-dir", os.path.join(temp_dir, "audit"),
+                "--state-dir", os.path.join(temp_dir, "state"),
+            ])
+
+        assert code == 0
+        assert json.loads(out.getvalue())["pipeline_id"] == "status-check"
+
+    def test_stream_object_under_redirect_stdout(self):
+        """Test that streamed objects fall back to text writes"""
+        out = io.StringIO()
+        sections = {"stage": "reports", "trail": [1, 2]}
+        with contextlib.redirect_stdout(out):
+            cli._stream_object(iter(sections.items()), indent=False)
+        assert json.loads(out.getvalue()) == sections
+
+
+class TestEnsureDirs:
+    """Test cases for audit/state directory resolution"""
+
+    def test_explicit_dirs_are_used(self, temp_dir):
+        """Test that explicit directories are returned untouched"""
+        args = argparse.Namespace(audit_dir=temp_dir + "/a", state_dir=temp_dir + "/s")
+        assert cli._ensure_dirs(args) == (temp_dir + "/a", temp_dir + "/s")
+
+    def test_missing_dirs_fall_back_to_tempdirs(self):
+        """Test that missing directories are created under the given prefix"""
+        audit_dir, state_dir = cli._ensure_dirs(argparse.Namespace(), prefix="are_test_")
+        assert os.path.basename(audit_dir).startswith("are_test_audit_")
+        assert os.path.basename(state_dir).startswith("are_test_state_")
+        assert os.path.isdir(audit_dir) and os.path.isdir(state_dir)
+
+
+class TestInputValidation:
+    """Test cases for --inputs validation"""
+
+    def test_object_is_accepted(self):
+        """Test that a JSON object is returned as a dict"""
+        assert cli._parse_object('{"data": {}}', "--inputs", cli._command_parser("run")) == {"data": {}}
+
+    def test_non_object_is_rejected(self, capsys):
+        """Test that a non-object JSON value is a usage error"""
+        with pytest.raises(SystemExit) as exc:
+            cli._parse_object("[1, 2]", "--inputs", cli._command_parser("run"))
+        assert exc.value.code == 2
+        err = capsys.readouterr().err
+        assert "--inputs must be a JSON object" in err
+        assert err.startswith("usage: auto-revision-epistemic-engine run ")
+
+    def test_run_reports_errors_with_run_usage(self, capsys):
+        """Test that cmd_run rejects bad --inputs through the run subparser"""
+        args = cli.build_parser().parse_args(["run", "--inputs", "[1]"])
+        with pytest.raises(SystemExit):
+            cli.cmd_run(args)
+        assert capsys.readouterr().err.startswith("usage: auto-revision-epistemic-engine run ")
+
+    def test_malformed_json_is_rejected(self, capsys):
+        """Test that malformed JSON is a usage error rather than a traceback"""
+        with pytest.raises(SystemExit):
+            cli._parse_object(b"{not json", "--inputs-file", cli._command_parser("run"))
+        assert "--inputs-file is not valid JSON" in capsys.readouterr().err
+
+    def test_config_file_is_memory_mapped_when_large(self, temp_dir, monkeypatch):
+        """Test that files over the threshold parse identically via mmap"""
+        path = os.path.join(temp_dir, "config.json")
+        with open(path, "w") as f:
+            json.dump({"inputs": {"records": list(range(100))}}, f)
+
+        expected = {"inputs": {"records": list(range(100))}}
+        assert cli._load_object_file(path, "--inputs-file", cli._command_parser("run")) == expected
+        monkeypatch.setattr(cli, "MMAP_THRESHOLD", 0)
+        assert cli._load_object_file(path, "--inputs-file", cli._command_parser("run")) == expected
+        monkeypatch.setattr(cli, "orjson", None)
+        assert cli._load_object_file(path, "--inputs-file", cli._command_parser("run")) == expected
+
+    def test_large_integers_survive_memory_mapped_files(self, temp_dir, monkeypatch):
+        """Test that integers beyond 64 bits in a mapped file are not turned into floats"""
+        path = os.path.join(temp_dir, "config.json")
+        with open(path, "w") as f:
+            f.write('{"random_seed": 123456789012345678901234567890}')
+
+        monkeypatch.setattr(cli, "MMAP_THRESHOLD", 0)
+        config = cli._load_object_file(path, "--inputs-file", cli._command_parser("run"))
+        assert config == {"random_seed": 123456789012345678901234567890}
+
+
+class TestRunCommand:
+    """Test cases for the run command"""
+
+    def test_run_with_inputs_file(self, temp_dir, capsys):
+        """Test that a config file drives both inputs and pipeline config"""
+        config_path = os.path.join(temp_dir, "pipeline.json")
+        with open(config_path, "w") as f:
+            json.dump({
+                "pipeline_id": "file-pipeline",
+                "random_seed": 7,
+                "inputs": {"data": {"records": 3}},
+                "ethics_config": {"enabled": False},
+            }, f)
+
+        args = cli.build_parser().parse_args([
+            "run",
+            "--inputs-file", config_path,
+            "--audit-dir", os.path.join(temp_dir, "audit"),
+            "--state-dir", os.path.join(temp_dir, "state"),
+        ])
+
+        assert cli.cmd_run(args) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result["success"] is True
+        assert result["pipeline_status"]["pipeline_id"] == "file-pipeline"
+
+    def test_run_fast_disables_optional_subsystems(self, temp_dir, capsys):
+        """Test that --fast turns off HRG, ethics and resource tracking"""
+        config_path = os.path.join(temp_dir, "pipeline.json")
+        with open(config_path, "w") as f:
+            json.dump({
+                "inputs": {"data": {"records": 3}},
+                "hrg_config": {"auto_approve": True},
+                "ethics_config": {"enabled": True},
+            }, f)
+
+        args = cli.build_parser().parse_args([
+            "run", "--fast",
+            "--inputs-file", config_path,
+            "--audit-dir", os.path.join(temp_dir, "audit"),
+            "--state-dir", os.path.join(temp_dir, "state"),
+        ])
+
+        assert cli.cmd_run(args) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result["success"] is True
+        for key in ("hrg_stats", "resource_stats", "ethics_compliance"):
+            assert key not in result["pipeline_status"]
+
+    def test_run_with_seed_beyond_64_bits(self, temp_dir, capsys):
+        """Test that a seed orjson cannot encode is still reported"""
+        args = cli.build_parser().parse_args([
+            "run",
+            "--seed", "123456789012345678901234567890",
+            "--inputs", '{"data": {"n": 1}}',
+            "--audit-dir", os.path.join(temp_dir, "audit"),
+            "--state-dir", os.path.join(temp_dir, "state"),
+        ])
+
+        assert cli.cmd_run(args) == 0
+        assert json.loads(capsys.readouterr().out)["success"] is True
+
+
+class TestAuditCommand:
+    """Test cases for the audit command"""
+
+    def test_audit_existing_log(self, temp_dir, capsys):
+        """Test verifying a log written by an earlier run"""
+        audit_dir = os.path.join(temp_dir, "audit")
+        run_args = cli.build_parser().parse_args([
+            "run", "--audit-dir", audit_dir, "--state-dir", os.path.join(temp_dir, "state"),
+        ])
+        assert cli.cmd_run(run_args) == 0
+        capsys.readouterr()
+
+        args = cli.build_parser().parse_args(["audit", "--audit-dir", audit_dir])
+        assert cli.cmd_audit(args) == 0
+        assert json.loads(capsys.readouterr().out)["chain_valid"] is True
+
+    def test_audit_requires_audit_dir_without_after_run(self, capsys):
+        """Test that a bare audit is a usage error rather than a fresh temp dir"""
+        args = cli.build_parser().parse_args(["audit"])
+        with pytest.raises(SystemExit) as exc:
+            cli.cmd_audit(args)
+        assert exc.value.code == 2
+        err = capsys.readouterr().err
+        assert err.startswith("usage: auto-revision-epistemic-engine audit ")
+        assert "--audit-dir is required" in err
+
+    def test_audit_missing_log_is_an_error(self, temp_dir, capsys):
+        """Test that a directory without a log is not reported as a valid chain"""
+        missing = os.path.join(temp_dir, "nonexistent")
+        args = cli.build_parser().parse_args(["audit", "--audit-dir", missing])
+        with pytest.raises(SystemExit) as exc:
+            cli.cmd_audit(args)
+        assert exc.value.code == 2
+        assert "No audit log found" in capsys.readouterr().err
+        assert not os.path.exists(missing)
+
+
+class TestDemoCommand:
+    """Test cases for the demo command"""
+
+    def test_demo_emits_ndjson(self, capsys):
+        """Test that each demo stage is one JSON object per line"""
+        args = cli.build_parser().parse_args(["demo"])
+
+        assert cli.cmd_demo(args) == 0
+        lines = capsys.readouterr().out.splitlines()
+        stages = [json.loads(line)["stage"] for line in lines]
+        assert stages == ["init", "execute", "result", "reports", "complete"]
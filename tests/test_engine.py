@@ -2,6 +2,10 @@
 Tests for the Auto-Revision Epistemic Engine
 """
 
+import json
+
+import pytest
+
 from auto_revision_epistemic_engine import AutoRevisionEngine
 
 
@@ -81,6 +85,29 @@ class TestAutoRevisionEngine:
         assert audit["total_entries"] > 0
         assert len(audit["attestations"]) >= 3  # At least 3 attestations
 
+    def test_audit_reader(self, engine_config):
+        """Test verifying an existing audit log without a full engine"""
+        engine = AutoRevisionEngine(**engine_config)
+        engine.execute(inputs={"data": {"records": 3}})
+        expected = engine.get_audit_trail()
+
+        reader = AutoRevisionEngine.reader(engine_config["audit_log_dir"])
+        summary = reader.get_trail_summary()
+
+        assert summary["chain_valid"] is True
+        assert summary["total_entries"] == expected["total_entries"]
+        # Opening a reader must not append to the log
+        assert reader.get_trail_summary()["total_entries"] == expected["total_entries"]
+
+    def test_audit_reader_requires_existing_log(self, temp_dir):
+        """Test that the reader refuses to verify a log that does not exist"""
+        import os
+
+        missing = os.path.join(temp_dir, "missing")
+        with pytest.raises(FileNotFoundError):
+            AutoRevisionEngine.reader(missing)
+        assert not os.path.exists(missing)
+
     def test_ethics_axiom(self):
         """Test adding custom ethical axiom"""
         engine = AutoRevisionEngine(
@@ -135,6 +162,138 @@ class TestAuditLogger:
         
         assert logger.verify_chain() is True
 
+    def test_merkle_frontier_matches_balanced_tree(self):
+        """Test that incremental appends give the same root as a full tree build"""
+        import blake3
+        from auto_revision_epistemic_engine.audit import IncrementalMerkleTree
+
+        leaves = [bytes([i]) * 32 for i in range(8)]
+        level = [blake3.blake3(b"\x00" + leaf).digest() for leaf in leaves]
+        while len(level) > 1:
+            level = [
+                blake3.blake3(b"\x01" + level[i] + level[i + 1]).digest()
+                for i in range(0, len(level), 2)
+            ]
+
+        tree = IncrementalMerkleTree()
+        for leaf in leaves:
+            tree.append(leaf)
+
+        assert tree.root_hash() == level[0]
+        assert tree.frontier[:3] == [None, None, None]
+
+    def test_merkle_frontier_round_trip(self):
+        """Test frontier growth and serialization for a non-power-of-two size"""
+        from auto_revision_epistemic_engine.audit import IncrementalMerkleTree
+
+        leaves = [bytes([i]) * 32 for i in range(11)]
+        tree = IncrementalMerkleTree()
+        roots = set()
+        for leaf in leaves:
+            tree.append(leaf)
+            roots.add(tree.root_hash())
+
+        restored = IncrementalMerkleTree.from_dict(tree.to_dict())
+        assert restored.size == 11
+        assert restored.root_hash() == tree.root_hash()
+        assert len(tree.frontier) == 4  # 11 = 0b1011
+        assert len(roots) == 11
+
+    def test_merkle_root_persists_across_reopen(self, temp_dir, monkeypatch):
+        """Test that reopening a log resumes from the checkpoint and folds only later entries"""
+        from auto_revision_epistemic_engine.audit import AuditLogger, IncrementalMerkleTree
+
+        logger = AuditLogger(log_dir=temp_dir)
+        for i in range(3):
+            logger.log_event(event_type=f"EVENT_{i}", actor="SYSTEM", action=f"Action {i}")
+        logger.checkpoint()
+        for i in range(3, 5):
+            logger.log_event(event_type=f"EVENT_{i}", actor="SYSTEM", action=f"Action {i}")
+
+        appended = []
+        original_append = IncrementalMerkleTree.append
+
+        def counting_append(tree, leaf):
+            appended.append(leaf)
+            original_append(tree, leaf)
+
+        monkeypatch.setattr(IncrementalMerkleTree, "append", counting_append)
+        reopened = AuditLogger(log_dir=temp_dir)
+        assert appended == []
+        assert reopened.merkle_root() == logger.merkle_root()
+        assert len(appended) == 2
+        monkeypatch.undo()
+        assert reopened.verify_chain() is True
+
+    def test_audit_chain_detects_truncation(self, temp_dir):
+        """Test that dropping trailing entries invalidates the chain"""
+        from auto_revision_epistemic_engine.audit import AuditLogger
+
+        logger = AuditLogger(log_dir=temp_dir)
+        for i in range(4):
+            logger.log_event(event_type=f"EVENT_{i}", actor="SYSTEM", action=f"Action {i}")
+        logger.checkpoint()
+
+        with open(logger.log_file, "r") as f:
+            lines = f.readlines()
+        with open(logger.log_file, "w") as f:
+            f.writelines(lines[:-1])
+
+        assert logger.verify_chain() is False
+
+        # Reopening must not replace the checkpoint that exposes the truncation
+        reopened = AuditLogger(log_dir=temp_dir)
+        reopened.log_event(event_type="EVENT_4", actor="SYSTEM", action="Action 4")
+        reopened.checkpoint()
+        assert reopened.verify_chain() is False
+
+    def test_corrupt_checkpoint_fails_verification(self, temp_dir):
+        """Test that an unreadable checkpoint is a failed check, not an exception"""
+        from auto_revision_epistemic_engine.audit import AuditLogger
+
+        logger = AuditLogger(log_dir=temp_dir)
+        logger.log_event(event_type="EVENT", actor="SYSTEM", action="Action")
+        logger.checkpoint()
+        with open(logger.frontier_file, "r") as f:
+            content = f.read()
+        with open(logger.frontier_file, "w") as f:
+            f.write(content[:10])
+
+        assert logger.verify_chain() is False
+        AuditLogger(log_dir=temp_dir)
+        with open(logger.frontier_file, "r") as f:
+            assert f.read() == content[:10]
+
+    def test_checkpoints_written_at_interval(self, temp_dir, monkeypatch):
+        """Test that the frontier is persisted every interval, not every append"""
+        from auto_revision_epistemic_engine.audit import AuditLogger, audit_logger
+
+        monkeypatch.setattr(audit_logger, "MERKLE_CHECKPOINT_INTERVAL", 3)
+        logger = AuditLogger(log_dir=temp_dir)
+        for i in range(2):
+            logger.log_event(event_type=f"EVENT_{i}", actor="SYSTEM", action=f"Action {i}")
+        assert not logger.frontier_file.exists()
+
+        logger.log_event(event_type="EVENT_2", actor="SYSTEM", action="Action 2")
+        with open(logger.frontier_file, "r") as f:
+            assert json.load(f)["size"] == 3
+        logger.log_event(event_type="EVENT_3", actor="SYSTEM", action="Action 3")
+        assert logger.verify_chain() is True
+
+    def test_checkpoint_write_failure_is_wrapped(self, temp_dir, monkeypatch):
+        """Test that checkpoint I/O errors surface as RuntimeError"""
+        from auto_revision_epistemic_engine.audit import AuditLogger, audit_logger
+
+        logger = AuditLogger(log_dir=temp_dir)
+        logger.log_event(event_type="EVENT", actor="SYSTEM", action="Action")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(audit_logger.os, "replace", fail)
+        with pytest.raises(RuntimeError, match="Merkle checkpoint"):
+            logger.checkpoint()
+
 
 class TestStateManager:
     """Test cases for state management"""